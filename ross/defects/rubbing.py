@@ -8,13 +8,245 @@ import ross
 from ross.units import Q_, check_units
 
 from .abs_defect import Defect
-from .integrate_solver import Integrator
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is optional, without it the kernels below run as plain python. With
+    # numba, _rub_force is compiled with fastmath, so the two paths agree only up
+    # to round-off.
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 __all__ = [
     "Rubbing",
 ]
 
 
+@njit(cache=True, fastmath=True)
+def _rub_force(x, y, vx, vy, ang, deltaRUB, kRUB, cRUB, miRUB, radius, torque):
+    """Calculates the rubbing force at the rubbing node.
+
+    This is the contact law evaluated at every step of the time integration, so it
+    is written with scalars only to be compiled with numba (when available).
+
+    Parameters
+    ----------
+    x, y : float
+        Displacements of the rubbing node at X / Y directions.
+    vx, vy : float
+        Velocities of the rubbing node at X / Y directions.
+    ang : float
+        Shaft angular speed.
+    deltaRUB : float
+        Distance between the housing and shaft surface.
+    kRUB : float
+        Contact stiffness.
+    cRUB : float
+        Contact damping.
+    miRUB : float
+        Friction coefficient.
+    radius : float
+        Shaft radius at the rubbing node.
+    torque : bool
+        Set it as True to consider the torque provided by the rubbing.
+
+    Returns
+    -------
+    force : numpy.ndarray
+        Force vector for the 6 degrees of freedom of the rubbing node.
+    """
+    force = np.zeros(6)
+
+    radial_displ_node = np.sqrt(x**2 + y**2)
+    # the clearance check is kept branchless: out of contact the penetration and
+    # the contact flag are zero, which cancels every force term below
+    penetration = max(radial_displ_node - deltaRUB, 0.0)
+    contact = 1.0 * (radial_displ_node >= deltaRUB)
+
+    # in contact radial_displ_node >= deltaRUB > 0, so the denominator is the
+    # radial displacement itself and the direction cosines need no trigonometry
+    r = max(radial_displ_node, deltaRUB)
+    cos_phi = x / r
+    sin_phi = y / r
+
+    # stiffness force
+    F_kx = -kRUB * penetration * cos_phi
+    F_ky = -kRUB * penetration * sin_phi
+    # damping force
+    F_cx = -cRUB * vx * contact
+    F_cy = -cRUB * vy * contact
+
+    # tangential force, opposing the relative sliding velocity
+    Vt = -vy * sin_phi + vx * cos_phi
+    slip = np.sign(Vt + ang * radius)
+    F_fx = -slip * miRUB * abs(F_kx + F_cx)
+    F_fy = slip * miRUB * abs(F_ky + F_cy)
+
+    force[0] = F_kx + F_cx + F_fx
+    force[1] = F_ky + F_cy + F_fy
+    if torque:
+        force[5] = radius * np.sqrt(F_fx**2 + F_fy**2) * cos_phi
+
+    return force
+
+
+@njit(cache=True)
+def _rub_equation_of_movement(Y, i, model, rub_params):
+    """Calculates the displacement and velocity using state-space representation in the modal domain.
+
+    Parameters
+    ----------
+    Y : array
+        Array of displacement and velocity, in the modal domain.
+    i : int
+        Iteration step.
+    model : tuple
+        Modal model of the rotor, as built by Rubbing._model:
+        (ModMat_rub, inv_Mmodal, Cmodal, Gmodal, Kmodal, Kstmodal, Funbmodal,
+        Omega, AccelV).
+    rub_params : tuple
+        Rubbing parameters, as built by Rubbing._rub_params:
+        (deltaRUB, kRUB, cRUB, miRUB, radius, torque).
+
+    Returns
+    -------
+    new_Y :  array
+        Array of the new displacement and velocity, in the modal domain.
+    Frub : array
+        Rubbing force at the rubbing node.
+    """
+    (
+        ModMat_rub,
+        inv_Mmodal,
+        Cmodal,
+        Gmodal,
+        Kmodal,
+        Kstmodal,
+        Funbmodal,
+        Omega,
+        AccelV,
+    ) = model
+
+    positions = Y[:12]
+    velocity = Y[12:]  # velocity in space state
+
+    # only the rubbing node is needed to evaluate the contact force
+    displ = ModMat_rub[:2].dot(positions)
+    vel = ModMat_rub[:2].dot(velocity)
+
+    Frub = _rub_force(displ[0], displ[1], vel[0], vel[1], Omega[i], *rub_params)
+    ftmodal = Frub.dot(ModMat_rub)
+
+    # proper equation of movement to be integrated in time
+    new_V_dot = (
+        ftmodal
+        + Funbmodal[:, i]
+        - ((Cmodal + Gmodal * Omega[i])).dot(velocity)
+        - ((Kmodal + Kstmodal * AccelV[i]).dot(positions))
+    ).dot(inv_Mmodal)
+
+    new_Y = np.zeros(24)
+    new_Y[:12] = velocity
+    new_Y[12:] = new_V_dot
+
+    return new_Y, Frub
+
+
+@njit(cache=True)
+def _rub_rk4(result, forces, tI, dt, model, rub_params, print_progress=False):
+    """Integrates the rubbing equation of movement with Runge-Kutta 4th order (RK4).
+
+    This follows Integrator.rk4, with the equation of movement compiled together
+    with the integration loop. The results are written in the preallocated arrays.
+
+    Parameters
+    ----------
+    result : array
+        Array with shape (24, n + 1) to store the displacement and velocity, in
+        the modal domain. The first column holds the initial condition.
+    forces : array
+        Array with shape (6, len(Omega)) to store the rubbing force at the
+        rubbing node. It is written in place, column by column, so it can be a
+        view of a larger array.
+    tI : float
+        Initial time.
+    dt : float
+        Time step.
+    model : tuple
+        Modal model of the rotor, see _rub_equation_of_movement.
+    rub_params : tuple
+        Rubbing parameters, see _rub_equation_of_movement.
+    print_progress : bool
+        Set it True, to print the time iterations, by default False.
+    """
+    y = result[:, 0].copy()
+    t = tI
+
+    for i in range(1, result.shape[1]):
+        if i % 10000 == 0 and print_progress:
+            print("Iteration:", i, "\n Time:", t)
+
+        k1, _ = _rub_equation_of_movement(y, i, model, rub_params)
+        k1 = dt * k1
+        k2, _ = _rub_equation_of_movement(y + 0.5 * k1, i, model, rub_params)
+        k2 = dt * k2
+        k3, _ = _rub_equation_of_movement(y + 0.5 * k2, i, model, rub_params)
+        k3 = dt * k3
+        k4, Frub = _rub_equation_of_movement(y + k3, i, model, rub_params)
+        k4 = dt * k4
+
+        # the stored force is the one from the last stage, as in Integrator.rk4
+        forces[:, i] = Frub
+
+        # Update next value of y
+        y = y + (1.0 / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
+        result[:, i] = y
+
+        # Update next value of t
+        t = t + dt
+
+
+@njit(parallel=True, cache=True)
+def _rub_rk4_batch(result, forces, tI, dt, model, rub_params):
+    """Runs _rub_rk4 for a batch of independent analyzes.
+
+    Each array in result, forces and model gets a leading dimension with the index
+    of the analysis. The analyzes do not share any state, so they are distributed
+    among threads with prange.
+    """
+    (
+        ModMat_rub,
+        inv_Mmodal,
+        Cmodal,
+        Gmodal,
+        Kmodal,
+        Kstmodal,
+        Funbmodal,
+        Omega,
+        AccelV,
+    ) = model
+
+    for j in prange(result.shape[0]):
+        model_j = (
+            ModMat_rub[j],
+            inv_Mmodal[j],
+            Cmodal[j],
+            Gmodal[j],
+            Kmodal[j],
+            Kstmodal[j],
+            Funbmodal[j],
+            Omega[j],
+            AccelV[j],
+        )
+        _rub_rk4(result[j], forces[j], tI, dt, model_j, rub_params)
+
+
 class Rubbing(Defect):
     """Contains a rubbing model for applications on finite element models of rotative machinery.
     The reference coordenates system is: z-axis throught the shaft center; x-axis and y-axis in the sensors' planes
@@ -115,7 +347,81 @@ class Rubbing(Defect):
              6 DoF rotor model.
 
         """
+        self._prepare(rotor)
+
+        result = np.zeros((24, int((self.tF - self.tI) / self.dt) + 1))
+        # the kernel writes the rubbing node rows of forces_rub in place
+        self.forces_rub = np.zeros((self.ndof, len(self.time_vector)))
+        forces = self.forces_rub[self.DoF[0] : self.DoF[-1] + 1]
+
+        t1 = time.time()
+        _rub_rk4(
+            result,
+            forces,
+            self.tI,
+            self.dt,
+            self._model(),
+            self._rub_params(),
+            self.print_progress,
+        )
+        t2 = time.time()
+        if self.print_progress:
+            print(f"Time spent: {t2-t1} s")
+
+        self._set_response(result)
+
+    @staticmethod
+    def run_batch(defects, rotor):
+        """Runs several rubbing analyzes in parallel.
+
+        The modal model of each defect is built sequentially and the time
+        integrations run in parallel (when numba is installed). All the defects must
+        share the time and the rubbing parameters, only the speed and unbalances may
+        change between them.
+
+        Parameters
+        ----------
+        defects : list
+            List of ross.Rubbing objects.
+        rotor : ross.Rotor Object
+             6 DoF rotor model.
+        """
+        # fmt: off
+        shared = ["dt", "tI", "tF", "deltaRUB", "kRUB", "cRUB", "miRUB", "posRUB",
+                  "torque"]
+        # fmt: on
+        if not defects:
+            raise ValueError("At least one defect must be given.")
+        ref = defects[0]
+        for defect in defects:
+            if any(getattr(defect, attr) != getattr(ref, attr) for attr in shared):
+                raise Exception(
+                    "The defects must have the same time and rubbing parameters!"
+                )
+            defect._prepare(rotor)
 
+        n_defects = len(defects)
+        result = np.zeros((n_defects, 24, int((ref.tF - ref.tI) / ref.dt) + 1))
+        forces_rub = np.zeros((n_defects, ref.ndof, len(ref.time_vector)))
+        forces = forces_rub[:, ref.DoF[0] : ref.DoF[-1] + 1]
+
+        models = [defect._model() for defect in defects]
+        # stack each array of the models, the analysis index being the first axis
+        model = tuple(np.array(arrays) for arrays in zip(*models))
+        _rub_rk4_batch(result, forces, ref.tI, ref.dt, model, ref._rub_params())
+
+        for j, defect in enumerate(defects):
+            defect.forces_rub = forces_rub[j]
+            defect._set_response(result[j])
+
+    def _prepare(self, rotor):
+        """Builds the modal model and the unbalance forces used in the integration.
+
+        Parameters
+        ----------
+        rotor : ross.Rotor Object
+             6 DoF rotor model.
+        """
         self.rotor = rotor
         self.n_disk = len(self.rotor.disk_elements)
         if self.n_disk != len(self.unbalance_magnitude):
@@ -169,6 +475,7 @@ class Rubbing(Defect):
 
         ModMat = ModMat[:, :12]
         self.ModMat = ModMat
+        self.ModMat_rub = ModMat[self.DoF]
 
         # Modal transformations
         self.Mmodal = ((ModMat.T).dot(self.M)).dot(ModMat)
@@ -177,7 +484,6 @@ class Rubbing(Defect):
         self.Kmodal = ((ModMat.T).dot(self.K)).dot(ModMat)
         self.Kstmodal = ((ModMat.T).dot(self.Kst)).dot(ModMat)
 
-        y0 = np.zeros(24)
         t_eval = np.arange(self.tI, self.tF + self.dt, self.dt)
         # t_eval = np.arange(self.tI, self.tF, self.dt)
         T = t_eval
@@ -196,7 +502,6 @@ class Rubbing(Defect):
         unby = np.zeros(len(self.angular_position))
 
         FFunb = np.zeros((self.ndof, len(t_eval)))
-        self.forces_rub = np.zeros((self.ndof, len(t_eval)))
 
         for ii in range(self.n_disk):
             self.tetaUNB[ii, :] = (
@@ -221,219 +526,57 @@ class Rubbing(Defect):
         self.Funbmodal = (self.ModMat.T).dot(FFunb)
 
         self.inv_Mmodal = np.linalg.pinv(self.Mmodal)
-        t1 = time.time()
-
-        x = Integrator(
-            self.tI,
-            y0,
-            self.tF,
-            self.dt,
-            self._equation_of_movement,
-            self.print_progress,
-        )
-        x = x.rk4()
-        t2 = time.time()
-        if self.print_progress:
-            print(f"Time spent: {t2-t1} s")
-
-        self.displacement = x[:12, :]
-        self.velocity = x[12:, :]
         self.time_vector = t_eval
-        self.response = self.ModMat.dot(self.displacement)
-
-    def _equation_of_movement(self, T, Y, i):
-        """Calculates the displacement and velocity using state-space representation in the modal domain.
-
-        Parameters
-        ----------
-        T : float
-            Iteration time.
-        Y : array
-            Array of displacement and velocity, in the modal domain.
-        i : int
-            Iteration step.
-
-        Returns
-        -------
-        new_Y :  array
-            Array of the new displacement and velocity, in the modal domain.
-        """
-
-        positions = Y[:12]
-        velocity = Y[12:]  # velocity in space state
-
-        positionsFis = self.ModMat.dot(positions)
-        velocityFis = self.ModMat.dot(velocity)
-
-        Frub, ft = self._rub(positionsFis, velocityFis, self.Omega[i])
-        self.forces_rub[:, i] = ft
-        ftmodal = (self.ModMat.T).dot(ft)
-
-        # proper equation of movement to be integrated in time
-        new_V_dot = (
-            ftmodal
-            + self.Funbmodal[:, i]
-            - ((self.Cmodal + self.Gmodal * self.Omega[i])).dot(velocity)
-            - ((self.Kmodal + self.Kstmodal * self.AccelV[i]).dot(positions))
-        ).dot(self.inv_Mmodal)
-
-        new_X_dot = velocity
-
-        new_Y = np.zeros(24)
-        new_Y[:12] = new_X_dot
-        new_Y[12:] = new_V_dot
-
-        return new_Y
-
-    def _rub(self, positionsFis, velocityFis, ang):
-        self.F_k = np.zeros(self.ndof)
-        self.F_c = np.zeros(self.ndof)
-        self.F_f = np.zeros(self.ndof)
-
-        self.y = np.concatenate((positionsFis, velocityFis))
-
-        ii = 0 + 6 * self.posRUB  # rubbing position
 
-        self.radial_displ_node = np.sqrt(
-            self.y[ii] ** 2 + self.y[ii + 1] ** 2
-        )  # radial displacement
-        self.radial_displ_vel_node = np.sqrt(
-            self.y[ii + self.ndof] ** 2 + self.y[ii + 1 + self.ndof] ** 2
-        )  # velocity
-        self.phi_angle = np.arctan2(self.y[ii + 1], self.y[ii])
-
-        if self.radial_displ_node >= self.deltaRUB:
-            self.F_k[ii] = self._stiffness_force(self.y[ii])
-            self.F_k[ii + 1] = self._stiffness_force(self.y[ii + 1])
-            self.F_c[ii] = self._damping_force(self.y[ii + self.ndof])
-            self.F_c[ii + 1] = self._damping_force(self.y[ii + 1 + self.ndof])
-
-            Vt = -self.y[ii + self.ndof + 1] * np.sin(self.phi_angle) + self.y[
-                ii + self.ndof
-            ] * np.cos(self.phi_angle)
-
-            if Vt + ang * self.radius > 0:
-                self.F_f[ii] = -self._tangential_force(self.F_k[ii], self.F_c[ii])
-                self.F_f[ii + 1] = self._tangential_force(
-                    self.F_k[ii + 1], self.F_c[ii + 1]
-                )
-
-                if self.torque:
-                    self.F_f[ii + 5] = self._torque_force(
-                        self.F_f[ii], self.F_f[ii + 1], self.y[ii]
-                    )
-            elif Vt + ang * self.radius < 0:
-                self.F_f[ii] = self._tangential_force(self.F_k[ii], self.F_c[ii])
-                self.F_f[ii + 1] = -self._tangential_force(
-                    self.F_k[ii + 1], self.F_c[ii + 1]
-                )
-
-                if self.torque:
-                    self.F_f[ii + 5] = self._torque_force(
-                        self.F_f[ii], self.F_f[ii + 1], self.y[ii]
-                    )
-
-        return self._combine_forces(self.F_k, self.F_c, self.F_f)
-
-    def _stiffness_force(self, y):
-        """Calculates the stiffness force
-
-        Parameters
-        ----------
-        y : float
-            Displacement value.
-
-        Returns
-        -------
-        force : numpy.float64
-            Force magnitude.
-        """
-        force = (
-            -self.kRUB
-            * (self.radial_displ_node - self.deltaRUB)
-            * y
-            / abs(self.radial_displ_node)
-        )
-        return force
-
-    def _damping_force(self, y):
-        """Calculates the damping force
-
-        Parameters
-        ----------
-        y : float
-            Displacement value.
+    def _model(self):
+        """Modal model of the rotor in the format used by the integration kernels.
 
         Returns
         -------
-        force : numpy.float64
-            Force magnitude.
+        model : tuple
+            (ModMat_rub, inv_Mmodal, Cmodal, Gmodal, Kmodal, Kstmodal, Funbmodal,
+            Omega, AccelV)
         """
-        force = (
-            -self.cRUB
-            * (self.radial_displ_vel_node)
-            * y
-            / abs(self.radial_displ_vel_node)
+        return (
+            self.ModMat_rub,
+            self.inv_Mmodal,
+            self.Cmodal,
+            self.Gmodal,
+            self.Kmodal,
+            self.Kstmodal,
+            self.Funbmodal,
+            self.Omega,
+            self.AccelV,
         )
-        return force
-
-    def _tangential_force(self, F_k, F_c):
-        """Calculates the tangential force
 
-        Parameters
-        ----------
-        y : float
-            Displacement value.
+    def _rub_params(self):
+        """Rubbing parameters in the format used by the integration kernels.
 
         Returns
         -------
-        force : numpy.float64
-            Force magnitude.
+        rub_params : tuple
+            (deltaRUB, kRUB, cRUB, miRUB, radius, torque)
         """
-        force = self.miRUB * (abs(F_k + F_c))
-        return force
-
-    def _torque_force(self, F_f, F_fp, y):
-        """Calculates the torque force
-
-        Parameters
-        ----------
-        y : float
-            Displacement value.
-
-        Returns
-        -------
-        force : numpy.float64
-            Force magnitude.
-        """
-        force = self.radius * (
-            np.sqrt(F_f**2 + F_fp**2) * y / abs(self.radial_displ_node)
+        return (
+            float(self.deltaRUB),
+            float(self.kRUB),
+            float(self.cRUB),
+            float(self.miRUB),
+            float(self.radius),
+            bool(self.torque),
         )
-        return force
 
-    def _combine_forces(self, F_k, F_c, F_f):
-        """Mounts the final force vector.
+    def _set_response(self, result):
+        """Stores the integration results.
 
         Parameters
         ----------
-        F_k : numpy.ndarray
-            Stiffness force vector.
-        F_c : numpy.ndarray
-            Damping force vector.
-        F_f : numpy.ndarray
-            Tangential force vector.
-
-        Returns
-        -------
-        Frub : numpy.ndarray
-            Final force vector for each degree of freedom.
-        FFrub : numpy.ndarray
-            Final force vector.
+        result : array
+            Displacement and velocity, in the modal domain.
         """
-        Frub = F_k[self.DoF] + F_c[self.DoF] + F_f[self.DoF]
-        FFrub = F_k + F_c + F_f
-
-        return Frub, FFrub
+        self.displacement = result[:12, :]
+        self.velocity = result[12:, :]
+        self.response = self.ModMat.dot(self.displacement)
 
     @property
     def forces(self):
@@ -473,11 +616,13 @@ def base_rotor_example():
             [0  ,  25,  64, 104, 124, 143, 175, 207, 239, 271,
             303, 335, 345, 355, 380, 408, 436, 466, 496, 526,
             556, 586, 614, 647, 657, 667, 702, 737, 772, 807,
-            842, 862, 881, 914]
-            )/ 1000
+            842, 862, 881, 914],
+            dtype=np.float64,
+            )
     # fmt: on
 
-    L = [L[i] - L[i - 1] for i in range(1, len(L))]
+    L /= 1000
+    L = np.diff(L)
 
     shaft_elem = [
         ross.ShaftElement6DoF(
@@ -2,18 +2,36 @@
 
 This module defines the PointMass class which will be used to link elements.
 """
-import os
-from pathlib import Path
+from functools import lru_cache
 
 import numpy as np
-import toml
-from plotly import graph_objects as go
 
 from ross.element import Element
 from ross.units import check_units
 
 __all__ = ["PointMass"]
 
+# point masses only contribute to the mass matrix, so C, K and G share a single
+# read-only zero block instead of allocating a new one on each call.
+_ZERO_2x2 = np.zeros((2, 2))
+_ZERO_2x2.setflags(write=False)
+
+
+@lru_cache(maxsize=None)
+def _mass_matrix(mx, my):
+    """Read-only mass matrix of a point mass, shared by equal point masses.
+
+    The matrix is cached at module level rather than on the instance, so it does
+    not show up in the element attributes (e.g. in summary) and copies of the
+    element still return the read-only array.
+    """
+    M = np.zeros((2, 2), dtype=np.float64)
+    M[0, 0] = mx
+    M[1, 1] = my
+    M.setflags(write=False)
+
+    return M
+
 
 class PointMass(Element):
     """A point mass element.
@@ -67,7 +85,11 @@ class PointMass(Element):
         self.color = color
 
     def __hash__(self):
-        return hash(self.tag)
+        if self.tag is not None:
+            return hash(self.tag)
+        # untagged point masses would all share hash(None). The hash is taken from
+        # attributes compared in __eq__, so equal point masses still hash equally.
+        return hash((self.n, self.mx, self.my))
 
     def __eq__(self, other):
         """Equality method for comparasions.
@@ -144,6 +166,8 @@ class PointMass(Element):
         -------
         M : np.ndarray
             A matrix of floats containing the values of the mass matrix.
+            The returned array is read-only and shared between calls, use
+            M().copy() if it needs to be modified.
 
         Examples
         --------
@@ -152,14 +176,7 @@ class PointMass(Element):
         array([[2., 0.],
                [0., 3.]])
         """
-        mx = self.mx
-        my = self.my
-        # fmt: off
-        M = np.array([[mx, 0],
-                      [0, my]])
-        # fmt: on
-
-        return M
+        return _mass_matrix(self.mx, self.my)
 
     def C(self):
         """Damping matrix for an instance of a point mass element.
@@ -171,6 +188,8 @@ class PointMass(Element):
         -------
         C : np.ndarray
             A matrix of floats containing the values of the damping matrix.
+            The returned array is read-only and shared between calls, use
+            C().copy() if it needs to be modified.
 
         Examples
         --------
@@ -179,8 +198,7 @@ class PointMass(Element):
         array([[0., 0.],
                [0., 0.]])
         """
-        C = np.zeros((2, 2))
-        return C
+        return _ZERO_2x2
 
     def K(self):
         """Stiffness matrix for an instance of a point mass element.
@@ -192,6 +210,8 @@ class PointMass(Element):
         -------
         K : np.ndarray
             A matrix of floats containing the values of the stiffness matrix.
+            The returned array is read-only and shared between calls, use
+            K().copy() if it needs to be modified.
 
         Examples
         --------
@@ -200,8 +220,7 @@ class PointMass(Element):
         array([[0., 0.],
                [0., 0.]])
         """
-        K = np.zeros((2, 2))
-        return K
+        return _ZERO_2x2
 
     def G(self):
         """Gyroscopic matrix for an instance of a point mass element.
@@ -213,6 +232,8 @@ class PointMass(Element):
         -------
         G : np.ndarray
             A matrix of floats containing the values of the gyroscopic matrix.
+            The returned array is read-only and shared between calls, use
+            G().copy() if it needs to be modified.
 
         Examples
         --------
@@ -221,8 +242,7 @@ class PointMass(Element):
         array([[0., 0.],
                [0., 0.]])
         """
-        G = np.zeros((2, 2))
-        return G
+        return _ZERO_2x2
 
     def dof_mapping(self):
         """Degrees of freedom mapping.
@@ -266,6 +286,9 @@ class PointMass(Element):
         fig : plotly.graph_objects.Figure
             The figure object which traces are added on.
         """
+        # plotting backend is only needed when the rotor is drawn
+        from plotly import graph_objects as go
+
         zpos, ypos = position
         radius = ypos / 12
 
@@ -1468,8 +1468,7 @@ class CampbellResults(Results):
             coloraxis_colorscale="rdbu",
             coloraxis_colorbar=dict(title=dict(text=title_text, side="right")),
         )
-        for k, v in default_values.items():
-            kwargs.setdefault(k, v)
+        kwargs = {**default_values, **kwargs}
 
         crit_x = []
         crit_y = []
@@ -47,7 +47,7 @@ from ross.results import (
 )
 from ross.shaft_element import ShaftElement, ShaftElement6DoF
 from ross.units import Q_, check_units
-from ross.utils import intersection
+from ross.utils import banded, intersection
 
 __all__ = ["Rotor", "CoAxialRotor", "rotor_example", "coaxrotor_example"]
 
@@ -55,6 +55,32 @@ __all__ = ["Rotor", "CoAxialRotor", "rotor_example", "coaxrotor_example"]
 colors = px.colors.qualitative.Dark24
 
 
+def _lu_factor(M):
+    """LU factorization of a matrix that raises if the matrix is singular.
+
+    la.lu_factor only warns on a zero pivot, while la.solve raises. The
+    factorization is checked here to keep the la.solve behaviour.
+
+    Parameters
+    ----------
+    M : np.ndarray
+        Square matrix to be factorized.
+
+    Returns
+    -------
+    lu_and_piv : tuple
+        LU factorization to be used with la.lu_solve.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", la.LinAlgWarning)
+        lu, piv = la.lu_factor(M)
+
+    if not np.all(np.diag(lu)):
+        raise la.LinAlgError("Matrix is singular.")
+
+    return lu, piv
+
+
 class Rotor(object):
     r"""A rotor object.
 
@@ -408,6 +434,8 @@ class Rotor(object):
                 df.loc[df.tag == elm.tag].index[0], "dof_global_index"
             ] = elm.dof_global_index
 
+        self._point_mass_soa = self._point_mass_arrays()
+
         # define positions for disks
         for disk in disk_elements:
             z_pos = nodes_pos[disk.n]
@@ -886,6 +914,28 @@ class Rotor(object):
 
         return results
 
+    def _point_mass_arrays(self):
+        """Arrays with the point masses data used to assemble the mass matrix.
+
+        Point masses only add their masses to the diagonal of the mass matrix, so
+        instead of scattering a 2x2 block for each element, they are stored as arrays
+        and added to the global matrix in a single pass.
+
+        Returns
+        -------
+        point_mass_soa : dict
+            Dictionary with the global indexes of the x and y dofs of each point
+            mass ("dofs") and the respective masses ("m"), interleaved as
+            [x_0, y_0, x_1, y_1, ...].
+        """
+        dofs = [list(p.dof_global_index.values()) for p in self.point_mass_elements]
+        m = [(p.mx, p.my) for p in self.point_mass_elements]
+
+        return dict(
+            dofs=np.array(dofs, dtype=int).reshape(-1),
+            m=np.array(m, dtype=np.float64).reshape(-1),
+        )
+
     def M(self, frequency=None):
         """Mass matrix for an instance of a rotor.
 
@@ -911,12 +961,19 @@ class Rotor(object):
             frequency = 0
 
         for elm in self.elements:
+            if isinstance(elm, PointMass):
+                continue
             dofs = list(elm.dof_global_index.values())
             try:
                 M0[np.ix_(dofs, dofs)] += elm.M(frequency)
             except TypeError:
                 M0[np.ix_(dofs, dofs)] += elm.M()
 
+        # point masses only fill the diagonal, whether they are isotropic or not.
+        # add.at accumulates point masses that share the same node.
+        pm = self._point_mass_soa
+        np.add.at(M0, (pm["dofs"], pm["dofs"]), pm["m"])
+
         return M0
 
     def K(self, frequency):
@@ -944,6 +1001,9 @@ class Rotor(object):
         K0 = np.zeros((self.ndof, self.ndof))
 
         for elm in self.elements:
+            # point masses do not contribute to the stiffness matrix
+            if isinstance(elm, PointMass):
+                continue
             dofs = list(elm.dof_global_index.values())
             try:
                 K0[np.ix_(dofs, dofs)] += elm.K(frequency)
@@ -1011,6 +1071,9 @@ class Rotor(object):
         C0 = np.zeros((self.ndof, self.ndof))
 
         for elm in self.elements:
+            # point masses do not contribute to the damping matrix
+            if isinstance(elm, PointMass):
+                continue
             dofs = list(elm.dof_global_index.values())
             try:
                 C0[np.ix_(dofs, dofs)] += elm.C(frequency)
@@ -1039,6 +1102,9 @@ class Rotor(object):
         G0 = np.zeros((self.ndof, self.ndof))
 
         for elm in self.elements:
+            # point masses do not contribute to the gyroscopic matrix
+            if isinstance(elm, PointMass):
+                continue
             dofs = list(elm.dof_global_index.values())
             G0[np.ix_(dofs, dofs)] += elm.G()
 
@@ -1077,10 +1143,13 @@ class Rotor(object):
         Z = np.zeros((self.ndof, self.ndof))
         I = np.eye(self.ndof)
 
+        # factorize the mass matrix once and reuse it for both solutions
+        M_lu = _lu_factor(-self.M(frequency))
+
         # fmt: off
         A = np.vstack(
             [np.hstack([Z, I]),
-             np.hstack([la.solve(-self.M(frequency), self.K(frequency) + self.Kst()*speed), la.solve(-self.M(frequency), (self.C(frequency) + self.G() * speed))])])
+             np.hstack([la.lu_solve(M_lu, self.K(frequency) + self.Kst()*speed), la.lu_solve(M_lu, (self.C(frequency) + self.G() * speed))])])
         # fmt: on
 
         return A
@@ -1330,9 +1399,11 @@ class Rotor(object):
         if frequency is None:
             frequency = speed
         A = self.A(speed=speed, frequency=frequency)
+        # factorize the mass matrix once and reuse it for B, C and D
+        M_lu = _lu_factor(self.M(frequency))
         # fmt: off
         B = np.vstack([Z,
-                       la.solve(self.M(frequency), B2)])
+                       la.lu_solve(M_lu, B2)])
         # fmt: on
 
         # y = Cx + Du
@@ -1342,9 +1413,9 @@ class Rotor(object):
         Ca = Z
 
         # fmt: off
-        C = np.hstack((Cd - Ca @ la.solve(self.M(frequency), self.K(frequency)), Cv - Ca @ la.solve(self.M(frequency), self.C(frequency))))
+        C = np.hstack((Cd - Ca @ la.lu_solve(M_lu, self.K(frequency)), Cv - Ca @ la.lu_solve(M_lu, self.C(frequency))))
         # fmt: on
-        D = Ca @ la.solve(self.M(frequency), B2)
+        D = Ca @ la.lu_solve(M_lu, B2)
 
         sys = signal.lti(A, B, C, D)
 
@@ -2577,6 +2648,70 @@ class Rotor(object):
         defect.run(self)
         return defect
 
+    def run_rubbing_batch(self, params, **kwargs):
+        """Run several analyzes with rubbing in parallel.
+
+        Execute the rubbing defect for each set of speed and unbalances in params.
+        The time integrations are independent and run in parallel when numba is
+        installed.
+
+        Parameters
+        ----------
+        params : np.ndarray
+            Array with shape (N, 2 * n_disk + 1). Each row holds the unbalance
+            magnitudes (kg.m), the unbalance phases (rad) and the speed (rad/s) for
+            one analysis, in this order.
+        **kwargs: dictionary
+            The remaining arguments of run_rubbing (dt, tI, tF, deltaRUB, kRUB,
+            cRUB, miRUB, posRUB, torque and print_progress), shared by all the
+            analyzes.
+
+        Returns
+        -------
+        defects : list
+            List with a ross.Rubbing object for each row of params.
+
+        Examples
+        --------
+        >>> from ross.defects.rubbing import base_rotor_example
+        >>> rotor = base_rotor_example()
+        >>> params = np.array([[5e-4, 0, -np.pi / 2, 0, 125.66],
+        ...                    [5e-4, 0, -np.pi / 2, 0, 150.0]])
+        >>> responses = rotor.run_rubbing_batch(
+        ...     params, dt=0.001, tI=0, tF=0.1, deltaRUB=7.95e-5, kRUB=1.1e6,
+        ...     cRUB=40, miRUB=0.3, posRUB=12,
+        ... )
+        >>> [response.speed for response in responses]
+        [125.66, 150.0]
+        """
+        params = np.atleast_2d(np.asarray(params, dtype=np.float64))
+        if params.size == 0:
+            raise ValueError("params must have at least one row.")
+        n_disk = len(self.disk_elements)
+        if params.ndim != 2 or params.shape[1] != 2 * n_disk + 1:
+            raise ValueError(
+                f"params must have shape (N, {2 * n_disk + 1}): the unbalance "
+                f"magnitudes and phases of the {n_disk} disks and the speed."
+            )
+        row_params = {"speed", "unbalance_magnitude", "unbalance_phase"}
+        if row_params.intersection(kwargs):
+            raise ValueError(
+                "speed, unbalance_magnitude and unbalance_phase are given by the "
+                "rows of params and can not be passed as keyword arguments."
+            )
+
+        defects = [
+            Rubbing(
+                unbalance_magnitude=row[:n_disk],
+                unbalance_phase=row[n_disk : 2 * n_disk],
+                speed=float(row[-1]),
+                **kwargs,
+            )
+            for row in params
+        ]
+        Rubbing.run_batch(defects, self)
+        return defects
+
     def run_crack(self, **kwargs):
         """Run an analyzes with rubbing.
 
@@ -2833,7 +2968,13 @@ class Rotor(object):
         weight = aux_rotor.M(0) @ gravity
 
         # calculates u, for [K]*(u) = (F)
-        displacement = (la.solve(aux_K, weight)).flatten()
+        # K only couples adjacent nodes, so the banded solver is used unless
+        # linked nodes (numbered after the shaft) make the band as wide as K.
+        l_and_u, aux_K_banded = banded(aux_K)
+        if max(l_and_u) < len(aux_K) // 2:
+            displacement = la.solve_banded(l_and_u, aux_K_banded, weight).flatten()
+        else:
+            displacement = (la.solve(aux_K, weight)).flatten()
         displacement_y = displacement[1 :: self.number_dof]
 
         # calculate forces
@@ -3590,6 +3731,8 @@ class CoAxialRotor(Rotor):
                 df.loc[df.tag == elm.tag].index[0], "dof_global_index"
             ] = elm.dof_global_index
 
+        self._point_mass_soa = self._point_mass_arrays()
+
         # define positions for disks
         for disk in disk_elements:
             z_pos = nodes_pos[disk.n]
@@ -2,7 +2,6 @@
 
 This modules provides functions to plot the elements statistic data.
 """
-from copy import copy
 
 import numpy as np
 from plotly import graph_objects as go
@@ -43,9 +42,6 @@ def plot_histogram(
     subplots : Plotly graph_objects.make_subplots()
         A figure with the histogram plots.
     """
-    histogram_kwargs = {} if histogram_kwargs is None else copy(histogram_kwargs)
-    plot_kwargs = {} if plot_kwargs is None else copy(plot_kwargs)
-
     hist_default_values = dict(
         histnorm="probability density",
         cumulative_enabled=False,
@@ -53,14 +49,12 @@ def plot_histogram(
         marker_color=tableau_colors["red"],
         opacity=1.0,
     )
-    for k, v in hist_default_values.items():
-        histogram_kwargs.setdefault(k, v)
+    histogram_kwargs = {**hist_default_values, **(histogram_kwargs or {})}
 
     plot_default_values = dict(
         line=dict(width=4.0, color=tableau_colors["blue"]), opacity=1.0
     )
-    for k, v in plot_default_values.items():
-        plot_kwargs.setdefault(k, v)
+    plot_kwargs = {**plot_default_values, **(plot_kwargs or {})}
 
     rows = 1 if len(var_list) < 2 else 2
     cols = len(var_list) // 2 + len(var_list) % 2
@@ -1,4 +1,5 @@
 import pickle
+from copy import deepcopy
 from pathlib import Path
 from tempfile import tempdir
 
@@ -23,6 +24,30 @@ def test_point_mass():
     assert_allclose(np.zeros((2, 2)), p.G())
 
 
+def test_matrices_are_read_only():
+    p = PointMass(n=0, m=10.0, tag="pointmass")
+
+    assert p.M() is p.M()
+    for matrix in (p.M(), p.C(), p.K(), p.G()):
+        assert not matrix.flags.writeable
+    assert not deepcopy(p).M().flags.writeable
+
+
+def test_summary():
+    p = PointMass(n=0, m=10.0, tag="pointmass")
+
+    assert "_M" not in p.summary()
+
+
+def test_hash():
+    p0 = PointMass(n=0, m=10.0)
+    p1 = PointMass(n=1, m=10.0)
+
+    assert hash(p0) != hash(p1)
+    assert hash(p0) == hash(PointMass(n=0, m=10.0))
+    assert len({p0, p1, PointMass(n=0, m=10.0)}) == 2
+
+
 def test_local_index():
     n = 0
     mx = 1.0
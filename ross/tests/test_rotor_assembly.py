@@ -1678,6 +1678,53 @@ def test_global_index():
     assert pointmass[1].dof_global_index["y_8"] == 31
 
 
+def test_point_mass_matrices():
+    shaft_elem = [
+        ShaftElement(0.25, 0, 0.05, material=steel, rotary_inertia=True)
+        for _ in range(6)
+    ]
+
+    bearing0 = BearingElement(0, n_link=7, kxx=1e6, cxx=0)
+    support0 = BearingElement(7, kxx=1e6, cxx=0, tag="Support0")
+    bearing1 = BearingElement(6, n_link=8, kxx=1e6, cxx=0)
+    support1 = BearingElement(8, kxx=1e6, cxx=0, tag="Support1")
+
+    point_mass0 = PointMass(7, mx=1.0, my=2.0)
+    point_mass1 = PointMass(8, m=3.0)
+
+    rotor = Rotor(
+        shaft_elem,
+        [],
+        [bearing0, bearing1, support0, support1],
+        [point_mass0, point_mass1],
+    )
+
+    M = rotor.M()
+    assert_allclose(np.diag(M)[28:], [1.0, 2.0, 3.0, 3.0])
+    assert_allclose(M[28:, :28], 0.0)
+    assert_allclose(rotor.G()[28:, :], 0.0)
+    assert_allclose(rotor.K(0)[28:, 28:], np.diag([2e6, 2e6, 2e6, 2e6]))
+
+
+def test_singular_mass_matrix():
+    shaft_elem = [
+        ShaftElement(0.25, 0, 0.05, material=steel, rotary_inertia=True)
+        for _ in range(6)
+    ]
+
+    bearing0 = BearingElement(0, n_link=7, kxx=1e6, cxx=0)
+    bearing1 = BearingElement(6, kxx=1e6, cxx=0)
+    support0 = BearingElement(7, kxx=1e6, cxx=0, tag="Support0")
+    point_mass0 = PointMass(7, m=0.0)
+
+    rotor = Rotor(shaft_elem, [], [bearing0, bearing1, support0], [point_mass0])
+
+    with pytest.raises(np.linalg.LinAlgError, match="singular"):
+        rotor.A(speed=0)
+    with pytest.raises(np.linalg.LinAlgError, match="singular"):
+        rotor._lti(speed=0)
+
+
 def test_distinct_dof_elements_error():
     with pytest.raises(Exception):
         i_d = 0
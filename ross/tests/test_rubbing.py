@@ -22,11 +22,13 @@ L = np.array(
         [0  ,  25,  64, 104, 124, 143, 175, 207, 239, 271,
         303, 335, 345, 355, 380, 408, 436, 466, 496, 526,
         556, 586, 614, 647, 657, 667, 702, 737, 772, 807,
-        842, 862, 881, 914]
-        )/ 1000
+        842, 862, 881, 914],
+        dtype=np.float64,
+        )
 # fmt: on
 
-L = [L[i] - L[i - 1] for i in range(1, len(L))]
+L /= 1000
+L = np.diff(L)
 
 shaft_elem = [
     rs.ShaftElement6DoF(
@@ -71,7 +73,7 @@ bearing1 = rs.BearingElement6DoF(
 rotor = rs.Rotor(shaft_elem, [disk0, disk1], [bearing0, bearing1])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def rub():
     unbalance_magnitudet = np.array([5e-4, 0])
     unbalance_phaset = np.array([-np.pi / 2, 0])
@@ -94,7 +96,7 @@ def rub():
     return rubbing
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def rub_units():
     unbalance_magnitudet = Q_(np.array([0.043398083107259365, 0]), "lb*in")
     unbalance_phaset = Q_(np.array([-90.0, 0.0]), "degrees")
@@ -141,533 +143,59 @@ def test_rub_parameters_units(rub_units):
     assert rub_units.speed == 125.66370614359172
 
 
-def test_rub_forces(rub):
+@pytest.fixture(scope="module")
+def rub_forces_ref():
+    # rubbing forces at the X and Y directions of the rubbing node
+    return np.load(Path(__file__).parent / "data/rub_forces_ref.npy")
+
+
+def test_rub_forces(rub, rub_forces_ref):
     assert rub.forces_rub[rub.posRUB * 6, :] == pytest.approx(
-        # fmt: off
-    np.array([ 0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        1.34106430e+00,  2.38612745e+00,  2.49817920e+00,  1.81347173e+00,
-        5.98445473e-01, -1.62547004e+00, -4.23917250e+00, -6.00118806e+00,
-       -6.20373067e+00, -4.73612273e+00, -2.73184699e+00, -2.58971885e+00,
-       -6.09874812e+00, -1.19048343e+01, -1.62930120e+01, -1.64120039e+01,
-       -1.22951018e+01, -6.47561269e+00, -1.92419235e+00,  3.53374623e-02,
-        1.47810258e-01,  6.34772882e-02,  1.83806641e-01,  4.43954908e-01,
-        5.92533172e-01,  5.51738633e-01,  6.18865825e-01,  1.16291085e+00,
-        1.99527847e+00,  2.28657481e+00,  1.21810729e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00, -1.55680614e-01,
-       -1.15087399e+00, -1.31570879e+00, -5.73686616e-01,  1.75075759e-01,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        1.35857558e+00,  4.63547122e+00,  8.26625410e+00,  1.07680988e+01,
-        1.13286366e+01,  9.96961037e+00,  7.44128958e+00,  4.81928761e+00,
-        2.91576005e+00,  1.93968467e+00,  1.61560462e+00,  1.51666598e+00,
-        1.30530274e+00,  8.25200469e-01,  1.14260074e-01, -1.19244337e+00,
-       -2.29090277e+00, -2.84242534e+00, -2.70568998e+00, -1.71797718e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-       -3.62954221e-01, -2.15664186e-02, -5.82573814e-01, -1.27145991e+00,
-       -1.38207772e+00, -8.36333007e-01,  0.00000000e+00, -1.52638197e+00,
-       -3.88459875e+00, -5.84147533e+00, -5.55533169e+00, -2.84156510e+00,
-        0.00000000e+00,  0.00000000e+00, -9.98460245e-01, -5.03924706e+00,
-       -7.75632048e+00, -7.28589841e+00, -4.21050757e+00, -6.78335856e-01,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        4.97669123e-01,  9.43108661e-01,  1.21217301e+00,  1.02059004e+00,
-        5.88846364e-01,  4.25532247e-01,  7.49102363e-01,  1.21248611e+00,
-        1.23719949e+00,  5.26714086e-01,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  8.30579340e-01,  2.26273248e+00,
-        2.80172735e+00,  2.36060364e+00,  1.47121281e+00,  9.05484679e-01,
-        1.10607178e+00,  1.80305085e+00,  2.28352354e+00,  2.03304519e+00,
-        1.10298146e+00,  3.77694650e-02,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00, -3.22380450e+00,
-       -5.68021237e+00, -5.83462167e+00, -3.25195544e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00, -9.90196556e-01,
-       -2.90885128e+00, -2.81169132e+00, -8.81117993e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  2.69024403e-01,  3.11412852e-01,  5.58798236e-01,
-        6.40371175e-01,  3.49164726e-01,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  2.36971006e-01,
-        1.21346945e+00,  2.18249083e+00,  2.84208082e+00,  2.99156571e+00,
-        2.55421246e+00,  1.59111859e+00,  3.14246711e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-       -9.16343507e-02,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00, -1.16296507e+00, -3.23286551e+00,
-       -4.51354090e+00, -3.98257895e+00, -1.81166144e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  2.12219345e-01,  2.21171647e-01,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00, -9.56292801e-01, -1.33271793e+00,
-       -1.03821500e-02,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00]),
-        abs=1e-6
-        # fmt: on
+        rub_forces_ref[0], abs=1e-6
     )
-
     assert rub.forces_rub[rub.posRUB * 6 + 1, :] == pytest.approx(
-        # fmt: off
-    np.array([ 0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-       -2.04165157e+00, -4.37810280e+00, -6.57666995e+00, -8.28694141e+00,
-       -9.37791126e+00, -9.76081035e+00, -9.25783043e+00, -7.68973505e+00,
-       -5.19539491e+00, -2.48084518e+00, -6.09414243e-01, -1.40464287e-01,
-       -2.91868675e-01,  5.94864394e-01,  3.76903307e+00,  7.17867399e+00,
-        8.50615176e+00,  6.92755001e+00,  3.76919148e+00,  1.38886654e+00,
-        1.14793265e+00,  2.47476310e+00,  3.69518317e+00,  3.56151341e+00,
-        2.15845164e+00,  7.22745269e-01,  4.64776971e-01,  1.32361970e+00,
-        2.08542187e+00,  1.74043906e+00,  3.68327123e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  1.40526270e+00,
-        3.91183574e+00,  6.08879987e+00,  6.05701802e+00,  3.35127909e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        1.33684009e+00,  4.74117308e+00,  5.66393572e+00,  3.75144548e+00,
-        2.83459537e-01, -1.61445732e+00, -2.61883874e+00, -2.76818696e+00,
-       -2.47679180e+00, -2.29014373e+00, -2.50794047e+00, -3.08754938e+00,
-       -3.77455164e+00, -4.26560645e+00, -4.33448168e+00, -3.93383052e+00,
-       -3.19736872e+00, -2.30738448e+00, -1.36778475e+00, -4.13019001e-01,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-       -2.30731635e-01, -2.71055349e+00, -3.77777456e+00, -3.19820518e+00,
-       -1.62052825e+00, -1.57786580e-01,  0.00000000e+00, -3.39194075e-01,
-       -1.19486567e+00, -1.40982868e+00, -8.24731765e-01,  1.77245380e-02,
-        0.00000000e+00,  0.00000000e+00,  1.12393272e+00,  3.42883960e+00,
-        6.44392419e+00,  7.74026022e+00,  6.02300041e+00,  2.15021680e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        1.31206244e+00,  2.88224433e+00,  2.70442915e+00,  1.31540273e+00,
-        6.83579157e-02, -1.44657955e-01, -9.74069771e-04,  2.01609711e-01,
-        7.58795510e-02, -1.14712672e-01,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00, -1.16918168e-01, -9.48748823e-02,
-       -3.74701248e-01, -6.68192840e-01, -7.77720853e-01, -8.15718667e-01,
-       -1.19404470e+00, -2.17926682e+00, -3.40215785e+00, -3.99418641e+00,
-       -3.25449483e+00, -1.22032570e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00, -1.72304245e+00,
-       -2.63776333e+00, -2.11110151e+00, -7.22241992e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  1.37988828e-01,
-       -1.36497601e-01,  1.32278945e-01,  5.15571508e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  8.42548433e-01,  2.72091640e+00,  3.24542027e+00,
-        2.03399132e+00,  3.77699186e-02,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00, -1.99799699e-01,
-        5.92260640e-02, -1.02272668e-02, -3.19939917e-01, -7.49813663e-01,
-       -1.06945353e+00, -1.04483902e+00, -5.36963585e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-       -3.23192576e-01,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  1.42596962e-01, -1.71901114e-01,
-       -7.45893810e-02,  3.71940362e-01,  6.24286373e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00, -9.16154067e-02, -8.72890060e-02,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  8.36067934e-01,  1.13854180e+00,
-        4.79721529e-01,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00]),
-        abs=1e-6
-        # fmt: on
+        rub_forces_ref[1], abs=1e-6
     )
 
 
-def test_rub_forces_units(rub_units):
+def test_rub_forces_units(rub_units, rub_forces_ref):
     assert rub_units.forces_rub[rub_units.posRUB * 6, :] == pytest.approx(
-        # fmt: off
-    np.array([ 0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        1.34106430e+00,  2.38612745e+00,  2.49817920e+00,  1.81347173e+00,
-        5.98445473e-01, -1.62547004e+00, -4.23917250e+00, -6.00118806e+00,
-       -6.20373067e+00, -4.73612273e+00, -2.73184699e+00, -2.58971885e+00,
-       -6.09874812e+00, -1.19048343e+01, -1.62930120e+01, -1.64120039e+01,
-       -1.22951018e+01, -6.47561269e+00, -1.92419235e+00,  3.53374623e-02,
-        1.47810258e-01,  6.34772882e-02,  1.83806641e-01,  4.43954908e-01,
-        5.92533172e-01,  5.51738633e-01,  6.18865825e-01,  1.16291085e+00,
-        1.99527847e+00,  2.28657481e+00,  1.21810729e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00, -1.55680614e-01,
-       -1.15087399e+00, -1.31570879e+00, -5.73686616e-01,  1.75075759e-01,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        1.35857558e+00,  4.63547122e+00,  8.26625410e+00,  1.07680988e+01,
-        1.13286366e+01,  9.96961037e+00,  7.44128958e+00,  4.81928761e+00,
-        2.91576005e+00,  1.93968467e+00,  1.61560462e+00,  1.51666598e+00,
-        1.30530274e+00,  8.25200469e-01,  1.14260074e-01, -1.19244337e+00,
-       -2.29090277e+00, -2.84242534e+00, -2.70568998e+00, -1.71797718e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-       -3.62954221e-01, -2.15664186e-02, -5.82573814e-01, -1.27145991e+00,
-       -1.38207772e+00, -8.36333007e-01,  0.00000000e+00, -1.52638197e+00,
-       -3.88459875e+00, -5.84147533e+00, -5.55533169e+00, -2.84156510e+00,
-        0.00000000e+00,  0.00000000e+00, -9.98460245e-01, -5.03924706e+00,
-       -7.75632048e+00, -7.28589841e+00, -4.21050757e+00, -6.78335856e-01,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        4.97669123e-01,  9.43108661e-01,  1.21217301e+00,  1.02059004e+00,
-        5.88846364e-01,  4.25532247e-01,  7.49102363e-01,  1.21248611e+00,
-        1.23719949e+00,  5.26714086e-01,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  8.30579340e-01,  2.26273248e+00,
-        2.80172735e+00,  2.36060364e+00,  1.47121281e+00,  9.05484679e-01,
-        1.10607178e+00,  1.80305085e+00,  2.28352354e+00,  2.03304519e+00,
-        1.10298146e+00,  3.77694650e-02,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00, -3.22380450e+00,
-       -5.68021237e+00, -5.83462167e+00, -3.25195544e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00, -9.90196556e-01,
-       -2.90885128e+00, -2.81169132e+00, -8.81117993e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  2.69024403e-01,  3.11412852e-01,  5.58798236e-01,
-        6.40371175e-01,  3.49164726e-01,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  2.36971006e-01,
-        1.21346945e+00,  2.18249083e+00,  2.84208082e+00,  2.99156571e+00,
-        2.55421246e+00,  1.59111859e+00,  3.14246711e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-       -9.16343507e-02,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00, -1.16296507e+00, -3.23286551e+00,
-       -4.51354090e+00, -3.98257895e+00, -1.81166144e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  2.12219345e-01,  2.21171647e-01,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00, -9.56292801e-01, -1.33271793e+00,
-       -1.03821500e-02,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00]),
-        abs=1e-6
-        # fmt: on
+        rub_forces_ref[0], abs=1e-6
     )
-
     assert rub_units.forces_rub[rub_units.posRUB * 6 + 1, :] == pytest.approx(
-        # fmt: off
-    np.array([ 0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-       -2.04165157e+00, -4.37810280e+00, -6.57666995e+00, -8.28694141e+00,
-       -9.37791126e+00, -9.76081035e+00, -9.25783043e+00, -7.68973505e+00,
-       -5.19539491e+00, -2.48084518e+00, -6.09414243e-01, -1.40464287e-01,
-       -2.91868675e-01,  5.94864394e-01,  3.76903307e+00,  7.17867399e+00,
-        8.50615176e+00,  6.92755001e+00,  3.76919148e+00,  1.38886654e+00,
-        1.14793265e+00,  2.47476310e+00,  3.69518317e+00,  3.56151341e+00,
-        2.15845164e+00,  7.22745269e-01,  4.64776971e-01,  1.32361970e+00,
-        2.08542187e+00,  1.74043906e+00,  3.68327123e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  1.40526270e+00,
-        3.91183574e+00,  6.08879987e+00,  6.05701802e+00,  3.35127909e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        1.33684009e+00,  4.74117308e+00,  5.66393572e+00,  3.75144548e+00,
-        2.83459537e-01, -1.61445732e+00, -2.61883874e+00, -2.76818696e+00,
-       -2.47679180e+00, -2.29014373e+00, -2.50794047e+00, -3.08754938e+00,
-       -3.77455164e+00, -4.26560645e+00, -4.33448168e+00, -3.93383052e+00,
-       -3.19736872e+00, -2.30738448e+00, -1.36778475e+00, -4.13019001e-01,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-       -2.30731635e-01, -2.71055349e+00, -3.77777456e+00, -3.19820518e+00,
-       -1.62052825e+00, -1.57786580e-01,  0.00000000e+00, -3.39194075e-01,
-       -1.19486567e+00, -1.40982868e+00, -8.24731765e-01,  1.77245380e-02,
-        0.00000000e+00,  0.00000000e+00,  1.12393272e+00,  3.42883960e+00,
-        6.44392419e+00,  7.74026022e+00,  6.02300041e+00,  2.15021680e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        1.31206244e+00,  2.88224433e+00,  2.70442915e+00,  1.31540273e+00,
-        6.83579157e-02, -1.44657955e-01, -9.74069771e-04,  2.01609711e-01,
-        7.58795510e-02, -1.14712672e-01,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00, -1.16918168e-01, -9.48748823e-02,
-       -3.74701248e-01, -6.68192840e-01, -7.77720853e-01, -8.15718667e-01,
-       -1.19404470e+00, -2.17926682e+00, -3.40215785e+00, -3.99418641e+00,
-       -3.25449483e+00, -1.22032570e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00, -1.72304245e+00,
-       -2.63776333e+00, -2.11110151e+00, -7.22241992e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  1.37988828e-01,
-       -1.36497601e-01,  1.32278945e-01,  5.15571508e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  8.42548433e-01,  2.72091640e+00,  3.24542027e+00,
-        2.03399132e+00,  3.77699186e-02,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00, -1.99799699e-01,
-        5.92260640e-02, -1.02272668e-02, -3.19939917e-01, -7.49813663e-01,
-       -1.06945353e+00, -1.04483902e+00, -5.36963585e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-       -3.23192576e-01,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  1.42596962e-01, -1.71901114e-01,
-       -7.45893810e-02,  3.71940362e-01,  6.24286373e-01,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00, -9.16154067e-02, -8.72890060e-02,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  8.36067934e-01,  1.13854180e+00,
-        4.79721529e-01,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00,  0.00000000e+00,  0.00000000e+00,  0.00000000e+00,
-        0.00000000e+00]),
-        abs=1e-6
-        # fmt: on
+        rub_forces_ref[1], abs=1e-6
+    )
+
+
+def test_rub_batch(rub):
+    params = np.array(
+        [
+            [5e-4, 0, -np.pi / 2, 0, 125.66370614359172],
+            [5e-4, 0, -np.pi / 2, 0, 100.0],
+        ]
+    )
+
+    rubbing = rotor.run_rubbing_batch(
+        params,
+        dt=0.001,
+        tI=0,
+        tF=0.5,
+        deltaRUB=7.95e-5,
+        kRUB=1.1e6,
+        cRUB=40,
+        miRUB=0.3,
+        posRUB=12,
     )
+
+    assert len(rubbing) == 2
+    assert rubbing[1].speed == 100.0
+    assert_allclose(rubbing[0].forces_rub, rub.forces_rub)
+    assert_allclose(rubbing[0].response, rub.response)
+    assert type(rubbing[1].speed) is float
+
+    with pytest.raises(ValueError, match="at least one row"):
+        rotor.run_rubbing_batch(np.empty((0, 5)), dt=0.001, tI=0, tF=0.5)
+    with pytest.raises(ValueError, match="shape"):
+        rotor.run_rubbing_batch(np.array([[5e-4, 0, -1.5, 125.66]]), dt=0.001)
+    with pytest.raises(ValueError, match="keyword arguments"):
+        rotor.run_rubbing_batch(params, dt=0.001, speed=100.0)
@@ -2,6 +2,7 @@
 import inspect
 import warnings
 from functools import wraps
+from numbers import Number
 from pathlib import Path
 
 import pint
@@ -123,10 +124,11 @@ def check_units(func):
     0.0127
     """
 
+    args_names = inspect.getfullargspec(func)[0]
+
     @wraps(func)
     def inner(*args, **kwargs):
         base_unit_args = []
-        args_names = inspect.getfullargspec(func)[0]
 
         for arg_name, arg_value in zip(args_names, args):
             names = arg_name.split("_")
@@ -145,6 +147,11 @@ def check_units(func):
                 names.insert(0, arg_name)
             for name in names:
                 if name in units and arg_value is not None:
+                    # plain numbers are already in the default unit, there is no
+                    # need to create a Quantity just to get its magnitude back
+                    if isinstance(arg_value, Number):
+                        base_unit_args.append(arg_value)
+                        break
                     # For now, we only return the magnitude for the converted Quantity
                     # If pint is fully adopted by ross in the future, and we have all Quantities
                     # using it, we could remove this, which would allows us to use pint in its full capability
@@ -178,6 +185,9 @@ def check_units(func):
                 names.insert(0, k)
             for name in names:
                 if name in units and v is not None:
+                    if isinstance(v, Number):
+                        base_unit_kwargs[k] = v
+                        break
                     try:
                         base_unit_kwargs[k] = v.to(units[name]).m
                     except AttributeError:
@@ -454,6 +454,48 @@ def convert(name):
     return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
 
 
+def banded(A):
+    """Convert a matrix to the banded storage used by scipy.linalg.solve_banded.
+
+    The number of lower and upper diagonals is detected from the nonzero entries
+    of the matrix. Rotor matrices only couple adjacent nodes, so their band is
+    narrow compared to the number of degrees of freedom.
+
+    Parameters
+    ----------
+    A : np.ndarray
+        Square matrix.
+
+    Returns
+    -------
+    l_and_u : tuple
+        Number of nonzero lower and upper diagonals.
+    ab : np.ndarray
+        Matrix in the banded storage, with ab[u + i - j, j] = A[i, j].
+
+    Examples
+    --------
+    >>> A = np.array([[4.0, 1.0, 0.0],
+    ...               [1.0, 4.0, 1.0],
+    ...               [0.0, 1.0, 4.0]])
+    >>> l_and_u, ab = banded(A)
+    >>> l_and_u
+    (1, 1)
+    >>> ab
+    array([[0., 1., 1.],
+           [4., 4., 4.],
+           [1., 1., 0.]])
+    """
+    rows, cols = np.nonzero(A)
+    l = max(int(np.max(rows - cols, initial=0)), 0)
+    u = max(int(np.max(cols - rows, initial=0)), 0)
+
+    ab = np.zeros((l + u + 1, A.shape[1]), dtype=A.dtype)
+    ab[u + rows - cols, cols] = A[rows, cols]
+
+    return (l, u), ab
+
+
 def intersection(x1, y1, x2, y2):
     """
     Intersection code from https://github.com/sukhbinder/intersection
@@ -58,7 +58,9 @@ EXTRAS = {
         "black",
         "isort",
         "sphinx-design",
-    ]
+        "numba",
+    ],
+    "numba": ["numba"],
 }
 
 # The rest you shouldn't have to touch too much :)